@@ -1,15 +1,24 @@
 from fastapi import FastAPI, Depends, HTTPException, Request, Form, Header
-from fastapi.responses import JSONResponse
-from sqlalchemy import create_engine, Column, String, Integer, Boolean, DateTime, ForeignKey, text
-from sqlalchemy.orm import sessionmaker, Session, declarative_base
+from fastapi.responses import ORJSONResponse
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Index, or_, select, update, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
-from datetime import datetime, timedelta
 import jwt
-from werkzeug.security import generate_password_hash, check_password_hash
+import bcrypt
+from werkzeug.security import check_password_hash
 from typing import Optional, Dict
 import urllib.parse
 import os
 from dotenv import load_dotenv
+from cachetools import TTLCache
+import hashlib
+import hmac
+import asyncio
 import time
 import logging
 
@@ -20,7 +29,7 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-app = FastAPI(title="User Authentication API")
+app = FastAPI(title="User Authentication API", default_response_class=ORJSONResponse)
 
 # Database Models
 Base = declarative_base()
@@ -28,9 +37,10 @@ Base = declarative_base()
 class User(Base):
     __tablename__ = 'Users'
     Id = Column(Integer, primary_key=True)
-    FullName = Column(String(100), nullable=False)
-    Email = Column(String(255), nullable=False)
-    PasswordHash = Column(String(255), nullable=False)
+    # Left empty for accounts created by /send-otp until /register-verified
+    FullName = Column(String(100), nullable=True)
+    Email = Column(String(255), nullable=True)
+    PasswordHash = Column(String(255), nullable=True)
     DeviceId = Column(String(255), nullable=True)
     CreatedAt = Column(DateTime, server_default=func.now())
     Status = Column(Boolean, default=True)
@@ -38,21 +48,29 @@ class User(Base):
     OTP = Column(String(6), nullable=True)
     IsPhoneVerified = Column(Boolean, default=False)
 
+    __table_args__ = (
+        # Covering index so login can be answered by an index-only scan
+        Index('ix_users_email', 'Email', unique=True,
+              postgresql_include=['Id', 'PasswordHash', 'FullName', 'CreatedAt', 'DeviceId', 'Status']),
+        Index('ix_users_mobile', 'Mobile', unique=True),
+    )
+
+async def _email_exists(db: AsyncSession, email: str) -> bool:
+    result = await db.execute(select(User.Id).where(User.Email == email).limit(1))
+    return result.first() is not None
+
 # Global variables for database connection
 engine = None
-SessionLocal = None
+AsyncSessionLocal = None
 
-def get_db():
-    if not SessionLocal:
-        init_db()
-    db = SessionLocal()
-    try:
+async def get_db():
+    if not AsyncSessionLocal:
+        await init_db()
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
-def init_db():
-    global engine, SessionLocal
+async def init_db():
+    global engine, AsyncSessionLocal
     max_retries = 5
     retry_delay = 2  # seconds
     
@@ -68,28 +86,44 @@ def init_db():
                 db_port = os.getenv('DB_PORT', '5432')
                 db_name = os.getenv('DB_NAME', 'michelanglo')
                 db_url = f"postgresql://{db_user}:{db_pass}@{db_host}:{db_port}/{db_name}"
+
+            # Use the asyncpg driver regardless of the scheme we were given.
+            # asyncpg rejects libpq's sslmode query parameter but accepts the
+            # same mode names through its ssl argument.
+            url = make_url(db_url).set(drivername='postgresql+asyncpg')
+            connect_args = {"server_settings": {"jit": "off"}}
+            sslmode = url.query.get('sslmode')
+            if sslmode:
+                connect_args["ssl"] = sslmode
+                url = url.difference_update_query(['sslmode'])
             
             logger.info(f"Attempting to connect to database (attempt {attempt + 1}/{max_retries})")
             
-            # Create engine with connection pooling and automatic reconnection
-            engine = create_engine(
-                db_url,
+            # Create engine with a fixed-size pool of long-lived connections.
+            # pool_size x uvicorn workers must stay within Postgres max_connections.
+            engine = create_async_engine(
+                url,
                 pool_pre_ping=True,
-                pool_size=5,
-                max_overflow=10,
-                pool_timeout=30
+                pool_size=int(os.getenv('DB_POOL_SIZE', '20')),
+                max_overflow=0,
+                pool_recycle=1800,
+                pool_timeout=10,
+                # Short lookups never benefit from JIT compilation
+                connect_args=connect_args
             )
             
             # Test the connection
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
                 logger.info("Database connection successful")
             
-            # Create session factory
-            SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+            # Create session factory; objects stay loaded after commit since
+            # lazy attribute refreshes are not possible under asyncio
+            AsyncSessionLocal = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)
             
             # Create all tables
-            Base.metadata.create_all(bind=engine)
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
             logger.info("Database tables created successfully")
             return
             
@@ -97,22 +131,37 @@ def init_db():
             logger.error(f"Database connection attempt {attempt + 1} failed: {str(e)}")
             if attempt < max_retries - 1:
                 logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                await asyncio.sleep(retry_delay)
             else:
                 logger.error("Failed to connect to database after all retries")
                 raise
 
+# Last health check result, reused briefly so frequent probes don't each
+# hit the database
+_HEALTH_TTL = 5  # seconds
+_health_cache = {"ts": 0.0, "val": None}
+
 # Health check endpoint with database verification
 @app.get("/health")
 async def health_check() -> Dict[str, str]:
     """
     Health check endpoint that verifies both application and database status.
     """
+    now = time.time()
+    if _health_cache["val"] and now - _health_cache["ts"] < _HEALTH_TTL:
+        return _health_cache["val"]
+    _health_cache["val"] = await _check_health()
+    _health_cache["ts"] = now
+    return _health_cache["val"]
+
+async def _check_health() -> Dict[str, str]:
     try:
-        # Test database connection
+        # Test database connection; AUTOCOMMIT skips the BEGIN/ROLLBACK
+        # that would otherwise wrap the trivial SELECT
         if engine:
-            with engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            async with engine.connect() as conn:
+                await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await conn.execute(text("SELECT 1"))
                 db_status = "healthy"
         else:
             db_status = "not initialized"
@@ -136,26 +185,114 @@ async def health_check() -> Dict[str, str]:
 async def root():
     return {"message": "Welcome to the API"}
 
+async def _warm_pool():
+    # Open a few pooled connections up front so early requests don't pay
+    # for connection setup; closing them returns them to the pool. This is
+    # best-effort: on failure the pool just keeps opening connections lazily.
+    count = min(int(os.getenv('DB_POOL_WARM', '5')), engine.pool.size())
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(count)),
+        return_exceptions=True
+    )
+    conns = [r for r in results if not isinstance(r, BaseException)]
+    try:
+        for conn in conns:
+            await conn.execute(text("SELECT 1"))
+        if len(conns) < count:
+            logger.warning(f"Database pool warm-up opened {len(conns)}/{count} connections: "
+                           f"{next(r for r in results if isinstance(r, BaseException))}")
+        else:
+            logger.info(f"Database pool warmed with {len(conns)} connections")
+    except Exception as e:
+        logger.warning(f"Database pool warm-up failed: {str(e)}")
+    finally:
+        for conn in conns:
+            await conn.close()
+
 # Initialize database on startup
 @app.on_event("startup")
 async def startup_event():
-    init_db()
+    await init_db()
+    await _warm_pool()
 
 # JWT configuration
 SECRET_KEY = os.getenv('SECRET_KEY', 'your_secret_key_here')
 ALGORITHM = os.getenv('ALGORITHM', 'HS256')
+_JWT_TTL = 30 * 24 * 60 * 60  # seconds
+_JWT_STATIC = {
+    "iss": "Issuer of the JWT",
+    "aud": "Audience that the JWT",
+    "sub": "Subject of the JWT",
+}
+
+def _issue_token(**claims) -> str:
+    now = int(time.time())
+    return jwt.encode({**_JWT_STATIC, "iat": now, "exp": now + _JWT_TTL, **claims}, SECRET_KEY, algorithm=ALGORITHM)
+
+# Short-lived cache of successful password checks. Keys include the stored
+# hash, so a password change naturally invalidates any previous entries.
+# Only positive results are cached to avoid acting as a brute-force oracle.
+# Keys are HMACs under a per-process secret, so a memory dump doesn't give
+# a fast offline target for recently used passwords.
+_pw_cache = TTLCache(maxsize=10000, ttl=30)
+_PW_CACHE_KEY = os.urandom(32)
+
+# bcrypt and hashlib's scrypt/PBKDF2 (used for legacy werkzeug hashes) all
+# release the GIL while hashing, so running these helpers in the threadpool
+# already hashes concurrently on all cores
+def _hash_password(password: str) -> str:
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=12)).decode('ascii')
+
+def _is_bcrypt_hash(stored_hash: str) -> bool:
+    return stored_hash.startswith('$2')
+
+def _check_password(stored_hash: str, password: str) -> bool:
+    if _is_bcrypt_hash(stored_hash):
+        return bcrypt.checkpw(password.encode(), stored_hash.encode('ascii'))
+    # Legacy werkzeug hash (scrypt by default in werkzeug 3.x, or PBKDF2);
+    # rehashed with bcrypt on successful login
+    return check_password_hash(stored_hash, password)
+
+async def _verify_password(stored_hash: str, password: str) -> bool:
+    # TTLCache is not thread-safe, so it is only touched on the event loop;
+    # just the KDF runs in the threadpool
+    key = hmac.new(_PW_CACHE_KEY, f"{stored_hash}:{password}".encode(), hashlib.sha256).digest()
+    if key in _pw_cache:
+        return True
+    ok = await run_in_threadpool(_check_password, stored_hash, password)
+    if ok:
+        _pw_cache[key] = True
+    return ok
+
+# Decoded JWT payloads keyed by token hash, so polling clients re-presenting
+# the same bearer token skip signature verification and JSON parsing.
+_jwt_cache = TTLCache(maxsize=10000, ttl=30)
+
+def _decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _jwt_cache.get(key)
+    if payload:
+        if payload['exp'] > time.time():
+            return payload
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    payload = jwt.decode(
+        token, SECRET_KEY, algorithms=[ALGORITHM],
+        audience=_JWT_STATIC["aud"], issuer=_JWT_STATIC["iss"]
+    )
+    _jwt_cache[key] = payload
+    return payload
 
 # Error handlers
 @app.exception_handler(404)
 async def not_found_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=404,
         content={"status": "0", "message": "Endpoint not found"}
     )
 
 @app.exception_handler(500)
 async def internal_error_handler(request: Request, exc: HTTPException):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={"status": "0", "message": "Internal server error"}
     )
@@ -168,88 +305,90 @@ async def signup(
     password: str = Form(...),
     mobile: Optional[str] = Form(None),
     device_id: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    try:
-        if not all([name, email, password]):
-            return JSONResponse(
-                status_code=400,
-                content={"status": "0", "message": "Full name, email, and password are required."}
-            )
-
-        # Check if email already exists
-        if db.query(User).filter(User.Email == email).first():
-            return JSONResponse(
-                status_code=409,
-                content={"status": "0", "message": "Email already registered."}
-            )
+    if not all([name, email, password]):
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "0", "message": "Full name, email, and password are required."}
+        )
 
-        # Create new user with required fields
-        new_user = User(
-            FullName=name,
-            Email=email,
-            PasswordHash=generate_password_hash(password),
-            Mobile=mobile,
-            DeviceId=device_id,
-            Status=True,
-            OTP=None,
-            IsPhoneVerified=False
+    # Check if email already exists
+    if await _email_exists(db, email):
+        return ORJSONResponse(
+            status_code=409,
+            content={"status": "0", "message": "Email already registered."}
         )
 
-        db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+    # Create new user with required fields
+    new_user = User(
+        FullName=name,
+        Email=email,
+        PasswordHash=await run_in_threadpool(_hash_password, password),
+        Mobile=mobile,
+        DeviceId=device_id,
+        Status=True,
+        OTP=None,
+        IsPhoneVerified=False
+    )
 
-        return JSONResponse(
-            status_code=201,
-            content={
-                "status": "1", 
-                "message": "New User Register Successfully.",
-                "user_id": new_user.Id
-            }
+    db.add(new_user)
+    # Id is populated from INSERT ... RETURNING during flush
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent registration for the same email or mobile
+        await db.rollback()
+        return ORJSONResponse(
+            status_code=409,
+            content={"status": "0", "message": "Email or mobile number already registered."}
         )
 
-    except Exception as e:
-        db.rollback()
-        return JSONResponse(
-            status_code=500,
-            content={"status": "0", "message": f"Registration failed: {str(e)}"}
-        )
+    return ORJSONResponse(
+        status_code=201,
+        content={
+            "status": "1", 
+            "message": "New User Register Successfully.",
+            "user_id": new_user.Id
+        }
+    )
 
 # Login API
 @app.post("/login")
 async def login(
     email: str = Form(...),
     password: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not email or not password:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"status": "0", "message": "Email and password are required."}
         )
 
-    user = db.query(User).filter(User.Email == email).first()
-    if not user or not check_password_hash(user.PasswordHash, password):
-        return JSONResponse(
+    result = await db.execute(
+        select(User.Id, User.PasswordHash, User.FullName, User.Email, User.CreatedAt, User.DeviceId)
+        .where(User.Email == email)
+    )
+    user = result.first()
+    if not user or not await _verify_password(user.PasswordHash, password):
+        return ORJSONResponse(
             status_code=401,
             content={"status": "0", "message": "Invalid email or password."}
         )
 
+    if not _is_bcrypt_hash(user.PasswordHash):
+        await db.execute(
+            update(User)
+            .where(User.Id == user.Id)
+            .values(PasswordHash=await run_in_threadpool(_hash_password, password))
+        )
+        await db.commit()
+
     # Generate JWT token
-    payload = {
-        "iss": "Issuer of the JWT",
-        "aud": "Audience that the JWT",
-        "sub": "Subject of the JWT",
-        "iat": datetime.utcnow(),
-        "exp": datetime.utcnow() + timedelta(days=30),
-        "email": user.Email,
-        "id": str(user.Id)
-    }
-
-    token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
-
-    return JSONResponse(
+    token = _issue_token(email=user.Email, id=str(user.Id))
+
+    return ORJSONResponse(
         status_code=200,
         content={
             "status": "1",
@@ -258,7 +397,6 @@ async def login(
                 "id": str(user.Id),
                 "user_name": user.FullName,
                 "email": user.Email,
-                "password": user.PasswordHash,
                 "created_at": user.CreatedAt.strftime("%Y-%m-%d %H:%M:%S"),
                 "device_id": user.DeviceId,
                 "access_token": token
@@ -270,32 +408,36 @@ async def login(
 @app.get("/user")
 async def get_user(
     authorization: str = Header(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not authorization:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=401,
             content={"status": "0", "message": "Token is missing."}
         )
 
     try:
-        if not authorization.startswith('Bearer '):
-            return JSONResponse(
+        if authorization[:7] != 'Bearer ':
+            return ORJSONResponse(
                 status_code=401,
                 content={"status": "0", "message": "Invalid token format. Use 'Bearer <token>'"}
             )
 
-        token = authorization.split(' ')[1]
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        token = authorization[7:]
+        payload = _decode_token(token)
         
-        user = db.query(User).filter(User.Id == payload['id']).first()
+        result = await db.execute(
+            select(User.Id, User.FullName, User.Email, User.CreatedAt, User.DeviceId, User.Status)
+            .where(User.Id == int(payload['id']))
+        )
+        user = result.first()
         if not user:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=404,
                 content={"status": "0", "message": "User not found."}
             )
 
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=200,
             content={
                 "status": "1",
@@ -312,98 +454,88 @@ async def get_user(
         )
 
     except jwt.ExpiredSignatureError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=401,
             content={"status": "0", "message": "Token has expired."}
         )
     except jwt.InvalidTokenError:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=401,
             content={"status": "0", "message": "Invalid token."}
         )
-    except Exception as e:
-        return JSONResponse(
-            status_code=401,
-            content={"status": "0", "message": f"Error: {str(e)}"}
-        )
 
 # Send OTP endpoint
 @app.post("/send-otp")
 async def send_otp(
     mobile: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not mobile:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"status": "0", "message": "Mobile number is required."}
         )
 
-    try:
-        default_otp = "9999"
-        user = db.query(User).filter(User.Mobile == mobile).first()
-        
-        if user:
-            if user.IsPhoneVerified and user.Email:
-                return JSONResponse(
-                    status_code=400,
-                    content={"status": "0", "message": "Mobile number already registered."}
-                )
-            user.OTP = default_otp
-            db.commit()
-        else:
-            new_user = User(
-                Mobile=mobile,
-                OTP=default_otp,
-                IsPhoneVerified=False
-            )
-            db.add(new_user)
-            db.commit()
-
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "1",
-                "message": "OTP sent successfully",
-                "result": {
-                    "mobile": mobile,
-                    "otp": default_otp
-                }
-            }
+    default_otp = "9999"
+    # Insert or refresh the OTP in one atomic statement; fully registered
+    # numbers are left untouched and return no row
+    stmt = (
+        pg_insert(User)
+        .values(Mobile=mobile, OTP=default_otp, IsPhoneVerified=False)
+        .on_conflict_do_update(
+            index_elements=['Mobile'],
+            set_={'OTP': default_otp},
+            where=or_(User.IsPhoneVerified.is_not(True), User.Email.is_(None))
         )
-
-    except Exception as e:
-        db.rollback()
-        return JSONResponse(
-            status_code=500,
-            content={"status": "0", "message": f"Error sending OTP: {str(e)}"}
+        .returning(User.Id)
+    )
+    if (await db.execute(stmt)).first() is None:
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "0", "message": "Mobile number already registered."}
         )
+    await db.commit()
+
+    return ORJSONResponse(
+        status_code=200,
+        content={
+            "status": "1",
+            "message": "OTP sent successfully",
+            "result": {
+                "mobile": mobile,
+                "otp": default_otp
+            }
+        }
+    )
 
 # Verify OTP endpoint
 @app.post("/verify-otp")
 async def verify_otp(
     mobile: str = Form(...),
     otp: str = Form(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not mobile or not otp:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"status": "0", "message": "Mobile number and OTP are required."}
         )
 
-    user = db.query(User).filter(User.Mobile == mobile).first()
-    
-    if not user or user.OTP != otp:
-        return JSONResponse(
+    # Check the OTP and mark the number verified in one atomic statement
+    result = await db.execute(
+        update(User)
+        .where(User.Mobile == mobile, User.OTP == otp)
+        .values(IsPhoneVerified=True)
+        .returning(User.Id)
+    )
+    if result.first() is None:
+        return ORJSONResponse(
             status_code=400,
             content={"status": "0", "message": "Invalid mobile number or OTP"}
         )
+    await db.commit()
 
-    user.IsPhoneVerified = True
-    db.commit()
-
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=200,
         content={
             "status": "1",
@@ -423,78 +555,72 @@ async def register_verified(
     email: str = Form(...),
     password: str = Form(...),
     device_id: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     if not all([mobile, name, email, password]):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=400,
             content={"status": "0", "message": "Mobile, name, email, and password are required."}
         )
 
-    try:
-        user = db.query(User).filter(User.Mobile == mobile).first()
-        
-        if not user:
-            return JSONResponse(
-                status_code=400,
-                content={"status": "0", "message": "Please verify your phone number first."}
-            )
+    # Fetch the mobile owner and any email holder in a single round trip
+    rows = (await db.scalars(select(User).where(or_(User.Mobile == mobile, User.Email == email)))).all()
+    user = next((r for r in rows if r.Mobile == mobile), None)
+    
+    if not user:
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "0", "message": "Please verify your phone number first."}
+        )
 
-        if not user.IsPhoneVerified:
-            return JSONResponse(
-                status_code=400,
-                content={"status": "0", "message": "Please verify your phone number first."}
-            )
+    if not user.IsPhoneVerified:
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "0", "message": "Please verify your phone number first."}
+        )
 
-        if db.query(User).filter(User.Email == email).first():
-            return JSONResponse(
-                status_code=400,
-                content={"status": "0", "message": "Email already registered."}
-            )
+    if any(r.Email == email for r in rows):
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "0", "message": "Email already registered."}
+        )
 
-        user.FullName = name
-        user.Email = email
-        user.PasswordHash = generate_password_hash(password)
-        user.DeviceId = device_id
-        
-        db.commit()
-
-        payload = {
-            "iss": "Issuer of the JWT",
-            "aud": "Audience that the JWT",
-            "sub": "Subject of the JWT",
-            "iat": datetime.utcnow(),
-            "exp": datetime.utcnow() + timedelta(days=30),
-            "id": str(user.Id)
-        }
+    user.FullName = name
+    user.Email = email
+    user.PasswordHash = await run_in_threadpool(_hash_password, password)
+    user.DeviceId = device_id
+    
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Email was taken by a concurrent registration
+        await db.rollback()
+        return ORJSONResponse(
+            status_code=400,
+            content={"status": "0", "message": "Email already registered."}
+        )
 
-        token = jwt.encode(payload, SECRET_KEY, algorithm=ALGORITHM)
+    token = _issue_token(id=str(user.Id))
 
-        return JSONResponse(
-            status_code=200,
-            content={
-                "status": "1",
-                "message": "User registered successfully",
-                "result": {
-                    "id": str(user.Id),
-                    "user_name": user.FullName,
-                    "email": user.Email,
-                    "mobile": user.Mobile,
-                    "created_at": user.CreatedAt.strftime("%Y-%m-%d %H:%M:%S"),
-                    "device_id": user.DeviceId,
-                    "status": "ACTIVE",
-                    "access_token": token
-                }
+    return ORJSONResponse(
+        status_code=200,
+        content={
+            "status": "1",
+            "message": "User registered successfully",
+            "result": {
+                "id": str(user.Id),
+                "user_name": user.FullName,
+                "email": user.Email,
+                "mobile": user.Mobile,
+                "created_at": user.CreatedAt.strftime("%Y-%m-%d %H:%M:%S"),
+                "device_id": user.DeviceId,
+                "status": "ACTIVE",
+                "access_token": token
             }
-        )
-
-    except Exception as e:
-        db.rollback()
-        return JSONResponse(
-            status_code=500,
-            content={"status": "0", "message": f"Registration error: {str(e)}"}
-        )
+        }
+    )
 
 if __name__ == '__main__':
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # uvicorn[standard] picks uvloop and httptools automatically where available
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, workers=int(os.getenv('WEB_CONCURRENCY', '1')), backlog=4096) 
\ No newline at end of file